@@ -591,3 +591,85 @@ def test_bitmap_instance_types():
     assert issubclass(TestBitmap, t.uint16_t)
     assert isinstance(TestBitmap(0xFF00), t.uint16_t)
     assert isinstance(TestBitmap(0xFF00), TestBitmap)
+
+
+def test_deserialize_memoryview():
+    # Deserialization accepts memoryviews, slicing the tail without copying
+    value, remaining = t.uint16_t.deserialize(memoryview(b"\x12\x34rest"))
+    assert value == 0x3412
+    assert remaining == b"rest"
+
+    value, remaining = t.uint24_t.deserialize(memoryview(b"\x01\x02\x03\xff"))
+    assert value == 0x030201
+    assert remaining == b"\xff"
+
+    lst, remaining = t.LVList[t.uint16_t].deserialize(
+        memoryview(b"\x02\x01\x00\x02\x00rest")
+    )
+    assert lst == [1, 2]
+    assert remaining == b"rest"
+
+    s, remaining = t.CharacterString.deserialize(memoryview(b"\x0412345"))
+    assert s == "1234"
+    assert s.raw == b"1234"
+    assert remaining == b"5"
+
+    b, remaining = t.LVBytes.deserialize(memoryview(b"\x0412345"))
+    assert b == b"1234"
+    assert remaining == b"5"
+
+
+def test_single_overflow_saturation():
+    # Finite doubles beyond the binary32 range saturate to +/-infinity instead
+    # of letting struct's OverflowError escape
+    assert t.Single(1e300).serialize() == struct.pack("<f", float("inf"))
+    assert t.Single(-1e300).serialize() == struct.pack("<f", float("-inf"))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        2,
+        1.25,
+        0,
+        -1.25,
+        -2,
+        float("nan"),
+        float("+inf"),
+        float("-inf"),
+        65504,
+        -65504,
+        2 ** -24,
+        -(2 ** -24),
+        struct.unpack("<e", bytes.fromhex("ff03"))[0],
+    ],
+)
+def test_half_with_struct(value):
+    # Half must match the behavior of the built-in struct module
+    assert t.Half(value).serialize() == struct.pack("<e", value)
+    v, remaining = t.Half.deserialize(struct.pack("<e", value))
+    assert compare_with_nan(v, t.Half(value))
+    assert remaining == b""
+
+
+def test_half_matches_native_format():
+    # Every binary16 bit pattern decodes exactly like struct's native "<e" and
+    # every non-NaN value round-trips bit-exactly
+    for pattern in range(0x10000):
+        data = struct.pack("<H", pattern)
+        value, _ = t.Half.deserialize(data)
+        expected = struct.unpack("<e", data)[0]
+
+        if math.isnan(expected):
+            assert math.isnan(value)
+        else:
+            assert value == expected
+            assert t.Half(value).serialize() == data
+
+
+def test_half_overflow_saturation():
+    # Values beyond the binary16 range saturate to +/-infinity, no matter how
+    # far beyond: just past 65504, past the binary32 maximum, or in between
+    for value in (65520.0, 1e20, 1e300):
+        assert t.Half(value).serialize() == t.Half(float("inf")).serialize()
+        assert t.Half(-value).serialize() == t.Half(float("-inf")).serialize()
@@ -1,21 +1,69 @@
 import enum
-import inspect
+import functools
 import struct
 from typing import Callable, Tuple, TypeVar
 
 CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)  # pylint: disable=invalid-name
 
+# Compiled packers for all integer sizes natively understood by `struct`, keyed by
+# signedness and shared by every subclass of a given width
+_INT_PACKERS = {
+    (False, 1): struct.Struct("<B"),
+    (True, 1): struct.Struct("<b"),
+    (False, 2): struct.Struct("<H"),
+    (True, 2): struct.Struct("<h"),
+    (False, 4): struct.Struct("<I"),
+    (True, 4): struct.Struct("<i"),
+    (False, 8): struct.Struct("<Q"),
+    (True, 8): struct.Struct("<q"),
+}
+
+
+def _specialize_int_methods(packer: struct.Struct, size: int):
+    """
+    Builds `serialize`/`deserialize` specialized for a single packer, closing over
+    its C-level methods so the hot path is a single call with no attribute lookups
+    or branching.
+    """
+    pack = packer.pack
+    unpack_from = packer.unpack_from
+
+    def serialize(self) -> bytes:
+        try:
+            return pack(self)
+        except struct.error as e:
+            # struct.error is not a subclass of ValueError, making it annoying
+            # to catch
+            raise ValueError(str(e)) from e
+
+    def deserialize(cls, data: bytes) -> Tuple["FixedIntType", bytes]:
+        try:
+            value = unpack_from(data)[0]
+        except struct.error:
+            raise ValueError(f"Data is too short to contain {size} bytes") from None
+
+        return cls(value), data[size:]
+
+    serialize._specialized = deserialize._specialized = True
+
+    return serialize, deserialize
+
 
 class FixedIntType(int):
+    __slots__ = ()
+
     _signed = None
     _size = None
+    _packer = None
 
     def __new__(cls, *args, **kwargs):
         if cls._signed is None or cls._size is None:
             raise TypeError(f"{cls} is abstract and cannot be created")
 
         instance = super().__new__(cls, *args, **kwargs)
-        instance.serialize()
+
+        if not cls._min <= instance <= cls._max:
+            raise ValueError(f"{int(instance)} is out of range of {cls.__name__}")
 
         return instance
 
@@ -28,6 +76,40 @@ class FixedIntType(int):
         if size is not None:
             cls._size = size
 
+        if cls._signed is not None and cls._size is not None:
+            if cls._signed:
+                cls._min = -(1 << (8 * cls._size - 1))
+                cls._max = (1 << (8 * cls._size - 1)) - 1
+            else:
+                cls._min = 0
+                cls._max = (1 << (8 * cls._size)) - 1
+
+            packer = _INT_PACKERS.get((cls._signed, cls._size))
+
+            if packer is not None:
+                cls._packer = packer
+                cls._pack = packer.pack
+                cls._unpack_from = packer.unpack_from
+
+                # Specialize the hot paths for this subclass, leaving explicit
+                # serialize/deserialize overrides alone
+                serialize, deserialize = _specialize_int_methods(packer, cls._size)
+
+                if cls.serialize is FixedIntType.serialize or getattr(
+                    cls.serialize, "_specialized", False
+                ):
+                    cls.serialize = serialize
+
+                if cls.deserialize.__func__ is FixedIntType.deserialize.__func__ or (
+                    getattr(cls.deserialize.__func__, "_specialized", False)
+                ):
+                    cls.deserialize = classmethod(deserialize)
+            else:
+                # Odd sizes are packed as the next-larger native size and truncated
+                cls._wide_packer = _INT_PACKERS[False, 4 if cls._size < 4 else 8]
+                cls._wide_padding = b"\x00" * (cls._wide_packer.size - cls._size)
+                cls._mask = (1 << (8 * cls._size)) - 1
+
         if hex_repr:
             fmt = f"0x{{:0{cls._size * 2}X}}"
             cls.__str__ = cls.__repr__ = lambda self: fmt.format(self)
@@ -41,92 +123,148 @@ class FixedIntType(int):
             cls.__new__ = cls.__new__
 
     def serialize(self) -> bytes:
-        try:
-            return self.to_bytes(self._size, "little", signed=self._signed)
-        except OverflowError as e:
-            # OverflowError is not a subclass of ValueError, making it annoying to catch
-            raise ValueError(str(e)) from e
+        if self._packer is not None:
+            try:
+                return self._pack(self)
+            except struct.error as e:
+                # struct.error is not a subclass of ValueError, making it annoying
+                # to catch
+                raise ValueError(str(e)) from e
+
+        if not self._min <= self <= self._max:
+            raise ValueError(f"{int(self)} is out of range of {type(self).__name__}")
+
+        # The masked value's little-endian low bytes are its two's complement encoding
+        return self._wide_packer.pack(self & self._mask)[: self._size]
 
     @classmethod
     def deserialize(cls, data: bytes) -> Tuple["FixedIntType", bytes]:
         if len(data) < cls._size:
             raise ValueError(f"Data is too short to contain {cls._size} bytes")
 
-        r = cls.from_bytes(data[: cls._size], "little", signed=cls._signed)
+        if cls._packer is not None:
+            r = cls(cls._unpack_from(data)[0])
+        else:
+            value = cls._wide_packer.unpack(
+                bytes(data[: cls._size]) + cls._wide_padding
+            )[0]
+
+            if value > cls._max:  # Sign-extend
+                value -= cls._mask + 1
+
+            r = cls(value)
+
         data = data[cls._size :]
         return r, data
 
+    @classmethod
+    def _bulk_deserialize(cls, data: bytes, count: int) -> Tuple[list, bytes]:
+        """
+        Deserializes `count` consecutive integers in a single pass. Only valid for
+        native-size subclasses that do not customize `__new__`.
+        """
+        end = count * cls._size
+
+        if len(data) < end:
+            raise ValueError(f"Data is too short to contain {cls._size} bytes")
+
+        items = [
+            int.__new__(cls, value) for (value,) in cls._packer.iter_unpack(data[:end])
+        ]
+        return items, data[end:]
+
+
+def _has_fast_int_path(item_type) -> bool:
+    """Item types with no custom `__new__` can be built directly from unpacked ints."""
+    return (
+        getattr(item_type, "_packer", None) is not None
+        and item_type.__new__ is FixedIntType.__new__
+    )
+
+
+def _pack_int_items(items, item_type, buf, offset) -> None:
+    """Packs a sequence of integers directly into `buf`, starting at `offset`."""
+    pack_into = item_type._packer.pack_into
+    size = item_type._size
+
+    try:
+        for item in items:
+            pack_into(buf, offset, int(item))
+            offset += size
+    except struct.error as e:
+        raise ValueError(str(e)) from e
+
 
 class uint_t(FixedIntType, signed=False):
-    pass
+    __slots__ = ()
 
 
 class int_t(FixedIntType, signed=True):
-    pass
+    __slots__ = ()
 
 
 class int8s(int_t, size=1):
-    pass
+    __slots__ = ()
 
 
 class int16s(int_t, size=2):
-    pass
+    __slots__ = ()
 
 
 class int24s(int_t, size=3):
-    pass
+    __slots__ = ()
 
 
 class int32s(int_t, size=4):
-    pass
+    __slots__ = ()
 
 
 class int40s(int_t, size=5):
-    pass
+    __slots__ = ()
 
 
 class int48s(int_t, size=6):
-    pass
+    __slots__ = ()
 
 
 class int56s(int_t, size=7):
-    pass
+    __slots__ = ()
 
 
 class int64s(int_t, size=8):
-    pass
+    __slots__ = ()
 
 
 class uint8_t(uint_t, size=1):
-    pass
+    __slots__ = ()
 
 
 class uint16_t(uint_t, size=2):
-    pass
+    __slots__ = ()
 
 
 class uint24_t(uint_t, size=3):
-    pass
+    __slots__ = ()
 
 
 class uint32_t(uint_t, size=4):
-    pass
+    __slots__ = ()
 
 
 class uint40_t(uint_t, size=5):
-    pass
+    __slots__ = ()
 
 
 class uint48_t(uint_t, size=6):
-    pass
+    __slots__ = ()
 
 
 class uint56_t(uint_t, size=7):
-    pass
+    __slots__ = ()
 
 
 class uint64_t(uint_t, size=8):
-    pass
+    __slots__ = ()
 
 
 class EnumIntFlagMixin:
@@ -135,8 +273,13 @@ class EnumIntFlagMixin:
     it doesn't actualy depend on the base class specifically being `int`.
     """
 
-    # Rebind classmethods to our own class
-    _missing_ = classmethod(enum.IntFlag._missing_.__func__)
+    __slots__ = ()
+
+    # Rebind classmethods to our own class. Unknown-value lookups are memoized so
+    # that repeated values skip the full pseudo-member creation path.
+    _missing_ = classmethod(
+        functools.lru_cache(maxsize=256)(enum.IntFlag._missing_.__func__)
+    )
     _create_pseudo_member_ = classmethod(enum.IntFlag._create_pseudo_member_.__func__)
 
     __or__ = enum.IntFlag.__or__
@@ -150,23 +293,36 @@ class EnumIntFlagMixin:
 
 class _IntEnumMeta(enum.EnumMeta):
     def __call__(cls, value, names=None, *args, **kwargs):
-        if isinstance(value, str) and value.startswith("0x"):
-            value = int(value, base=16)
-        else:
-            value = int(value)
+        value_type = type(value)
+
+        # Freshly-decoded values are already plain ints, only coerce the rest
+        if value_type is not int:
+            if value_type is str and value.startswith("0x"):
+                value = int(value, base=16)
+            else:
+                value = int(value)
+
         return super().__call__(value, names, *args, **kwargs)
 
 
 def enum_factory(int_type: CALLABLE_T, undefined: str = "undefined") -> CALLABLE_T:
     """Enum factory."""
 
+    # Pseudo-members for unknown values are interned, keyed by (class, value).
+    # This lives in the closure: a class-body dict would become an enum member.
+    unknown_members = {}
+
     class _NewEnum(int_type, enum.Enum, metaclass=_IntEnumMeta):
         @classmethod
         def _missing_(cls, value):
-            new = cls._member_type_.__new__(cls, value)
-            name = f"{undefined}_0x{{:0{cls._size * 2}x}}"  # pylint: disable=protected-access
-            new._name_ = name.format(value)
-            new._value_ = value
+            new = unknown_members.get((cls, value))
+
+            if new is None:
+                new = cls._member_type_.__new__(cls, value)
+                new._name_ = f"{undefined}_0x{value:0{cls._size * 2}x}"  # pylint: disable=protected-access
+                new._value_ = value
+                unknown_members[cls, value] = new
+
             return new
 
     return _NewEnum
@@ -213,10 +369,15 @@ class bitmap64(EnumIntFlagMixin, uint64_t, enum.Flag):
 
 
 class BaseFloat(float):
+    __slots__ = ()
+
     _exponent_bits = None
     _fraction_bits = None
     _size = None
 
+    _double = struct.Struct("<d")
+    _double_bits = struct.Struct("<Q")
+
     def __init_subclass__(cls, exponent_bits, fraction_bits):
         size_bits = 1 + exponent_bits + fraction_bits
         assert size_bits % 8 == 0
@@ -224,6 +385,13 @@ class BaseFloat(float):
         cls._exponent_bits = exponent_bits
         cls._fraction_bits = fraction_bits
         cls._size = size_bits // 8
+        cls._bits_packer = struct.Struct({2: "<H", 4: "<I", 8: "<Q"}[cls._size])
+
+        # Constants used on every conversion, computed once per format
+        cls._sign_shift = exponent_bits + fraction_bits
+        cls._exp_mask = (1 << exponent_bits) - 1
+        cls._frac_mask = (1 << fraction_bits) - 1
+        cls._exp_bias = 1 << (exponent_bits - 1)
 
     @staticmethod
     def _convert_format(*, src: "BaseFloat", dst: "BaseFloat", n: int) -> int:
@@ -237,20 +405,20 @@ class BaseFloat(float):
             conversion to a "bigger" representation.
         """
 
-        src_sign = n >> (src._exponent_bits + src._fraction_bits)
-        src_frac = n & ((1 << src._fraction_bits) - 1)
-        src_biased_exp = (n >> src._fraction_bits) & ((1 << src._exponent_bits) - 1)
-        src_exp = src_biased_exp - 2 ** (src._exponent_bits - 1)
+        src_sign = n >> src._sign_shift
+        src_frac = n & src._frac_mask
+        src_biased_exp = (n >> src._fraction_bits) & src._exp_mask
 
-        if src_biased_exp == (1 << src._exponent_bits) - 1:
-            dst_biased_exp = 2 ** dst._exponent_bits - 1
+        if src_biased_exp == src._exp_mask:
+            dst_biased_exp = dst._exp_mask
         elif src_biased_exp == 0:
             dst_biased_exp = 0
         else:
-            dst_min_exp = 2 - 2 ** (dst._exponent_bits - 1)  # Can't be all zeroes
-            dst_max_exp = 2 ** (dst._exponent_bits - 1) - 2  # Can't be all ones
+            src_exp = src_biased_exp - src._exp_bias
+            dst_min_exp = 2 - dst._exp_bias  # Can't be all zeroes
+            dst_max_exp = dst._exp_bias - 2  # Can't be all ones
             dst_exp = min(max(dst_min_exp, src_exp), dst_max_exp)
-            dst_biased_exp = dst_exp + 2 ** (dst._exponent_bits - 1)
+            dst_biased_exp = dst_exp + dst._exp_bias
 
         # We add/remove LSBs
         if src._fraction_bits > dst._fraction_bits:
@@ -259,47 +427,140 @@ class BaseFloat(float):
             dst_frac = src_frac << (dst._fraction_bits - src._fraction_bits)
 
         return (
-            src_sign << (dst._exponent_bits + dst._fraction_bits)
-            | dst_biased_exp << (dst._fraction_bits)
+            src_sign << dst._sign_shift
+            | dst_biased_exp << dst._fraction_bits
             | dst_frac
         )
 
     def serialize(self) -> bytes:
-        return self._convert_format(
-            src=Double, dst=self, n=int.from_bytes(struct.pack("<d", self), "little")
-        ).to_bytes(self._size, "little")
+        n = self._double_bits.unpack(self._double.pack(self))[0]
+        return self._bits_packer.pack(self._convert_format(src=Double, dst=self, n=n))
 
     @classmethod
     def deserialize(cls, data: bytes) -> Tuple["BaseFloat", bytes]:
         if len(data) < cls._size:
             raise ValueError(f"Data is too short to contain {cls._size} bytes")
 
-        double_bytes = cls._convert_format(
-            src=cls, dst=Double, n=int.from_bytes(data[: cls._size], "little")
-        ).to_bytes(Double._size, "little")
+        n = cls._convert_format(
+            src=cls, dst=Double, n=cls._bits_packer.unpack_from(data)[0]
+        )
 
-        return cls(struct.unpack("<d", double_bytes)[0]), data[cls._size :]
+        return cls(cls._double.unpack(cls._double_bits.pack(n))[0]), data[cls._size :]
 
 
 class Half(BaseFloat, exponent_bits=5, fraction_bits=10):
-    pass
+    __slots__ = ()
+
+    _struct = struct.Struct("<H")
+    _fp32 = struct.Struct("<f")
+    _fp32_bits = struct.Struct("<I")
+
+    def serialize(self) -> bytes:
+        # Convert through the IEEE 754 binary32 bit pattern with a handful of
+        # integer operations instead of the generic format conversion
+        try:
+            bits = self._fp32_bits.unpack(self._fp32.pack(self))[0]
+        except OverflowError:
+            # Finite doubles beyond even the binary32 range saturate to infinity
+            return self._struct.pack(0x7C00 if self > 0 else 0xFC00)
+
+        sign = (bits >> 16) & 0x8000
+
+        if bits & 0x7F800000 == 0x7F800000:
+            # Infinities and NaNs, the latter keeping a non-zero fraction
+            frac = bits & 0x007FFFFF
+            half = sign | 0x7C00 | (frac >> 13)
+
+            if frac and not frac >> 13:
+                half |= 1  # The truncated NaN payload must not decay to infinity
+        else:
+            bits += 0x00001000  # Round the truncated fraction
+            exp = (bits & 0x7F800000) >> 23
+            frac = bits & 0x007FFFFF
+
+            if exp > 142:  # Overflows become infinity
+                half = sign | 0x7C00
+            elif exp > 112:  # Normal numbers
+                half = sign | ((exp - 112) << 10) | (frac >> 13)
+            elif exp > 101:  # Subnormal numbers
+                half = sign | ((((0x007FF000 + frac) >> (125 - exp)) + 1) >> 1)
+            else:  # Underflows to zero
+                half = sign
+
+        return self._struct.pack(half)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> Tuple["Half", bytes]:
+        if len(data) < cls._size:
+            raise ValueError(f"Data is too short to contain {cls._size} bytes")
+
+        half = cls._struct.unpack_from(data)[0]
+        sign = (half & 0x8000) << 16
+        exp = (half & 0x7C00) >> 10
+        frac = half & 0x03FF
+
+        if exp == 0x1F:  # Infinities and NaNs
+            bits = sign | 0x7F800000 | (frac << 13)
+        elif exp:  # Normal numbers
+            bits = sign | ((exp + 112) << 23) | (frac << 13)
+        elif frac:  # Subnormal numbers, renormalized for binary32
+            shift = 24 - frac.bit_length()
+            bits = sign | ((126 - shift) << 23) | ((frac << shift) & 0x007FFFFF)
+        else:  # Zeroes
+            bits = sign
+
+        return cls(cls._fp32.unpack(cls._fp32_bits.pack(bits))[0]), data[cls._size :]
 
 
 class Single(BaseFloat, exponent_bits=8, fraction_bits=23):
-    pass
+    __slots__ = ()
+
+    # The format matches the native one, no conversion necessary
+    _struct = struct.Struct("<f")
+
+    def serialize(self) -> bytes:
+        try:
+            return self._struct.pack(self)
+        except OverflowError:
+            # Finite doubles beyond the binary32 range saturate to infinity
+            return self._struct.pack(float("inf") if self > 0 else float("-inf"))
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> Tuple["Single", bytes]:
+        if len(data) < cls._size:
+            raise ValueError(f"Data is too short to contain {cls._size} bytes")
+
+        return cls(cls._struct.unpack_from(data)[0]), data[cls._size :]
 
 
 class Double(BaseFloat, exponent_bits=11, fraction_bits=52):
-    pass
+    __slots__ = ()
+
+    # The format matches the native one, no conversion necessary
+    _struct = struct.Struct("<d")
+
+    def serialize(self) -> bytes:
+        return self._struct.pack(self)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> Tuple["Double", bytes]:
+        if len(data) < cls._size:
+            raise ValueError(f"Data is too short to contain {cls._size} bytes")
+
+        return cls(cls._struct.unpack_from(data)[0]), data[cls._size :]
 
 
 class LVBytes(bytes):
+    __slots__ = ()
+
     _prefix_length = 1
+    _len_packer = struct.Struct("<B")
+    _max_length = 2 ** 8 - 1
 
     def serialize(self):
-        if len(self) >= pow(256, self._prefix_length) - 1:
+        if len(self) >= self._max_length:
             raise ValueError("OctetString is too long")
-        return len(self).to_bytes(self._prefix_length, "little", signed=False) + self
+        return self._len_packer.pack(len(self)) + self
 
     @classmethod
     def deserialize(cls, data):
@@ -317,7 +578,11 @@ class LVBytes(bytes):
 
 
 class LongOctetString(LVBytes):
+    __slots__ = ()
+
     _prefix_length = 2
+    _len_packer = struct.Struct("<H")
+    _max_length = 2 ** 16 - 1
 
 
 class KwargTypeMeta(type):
@@ -346,28 +611,27 @@ class KwargTypeMeta(type):
         if not isinstance(key, tuple):
             key = (key,)
 
-        signature = inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name=k,
-                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=v if v is not None else inspect.Parameter.empty,
-                )
-                for k, v in cls._getitem_kwargs.items()
-            ]
-        )
+        defaults = cls._getitem_kwargs
+
+        if len(key) > len(defaults):
+            raise TypeError(f"Too many arguments for {cls}: expected {len(defaults)}")
 
-        bound = signature.bind(*key)
-        bound.apply_defaults()
+        kwargs = dict(defaults)
+        kwargs.update(zip(defaults, key))
+
+        # Arguments without a default (i.e. None) must all be provided
+        for name in list(defaults)[len(key) :]:
+            if defaults[name] is None:
+                raise TypeError(f"Missing required argument {name!r} for {cls}")
 
         # Default types need to work, which is why we need to create the key down here
-        expanded_key = tuple(bound.arguments.values())
+        expanded_key = tuple(kwargs.values())
 
         if (cls, expanded_key) in cls._anonymous_classes:
             return cls._anonymous_classes[cls, expanded_key]
 
-        class AnonSubclass(cls, **bound.arguments):
-            pass
+        class AnonSubclass(cls, **kwargs):
+            __slots__ = ()
 
         AnonSubclass.__name__ = AnonSubclass.__qualname__ = f"Anonymous{cls.__name__}"
         cls._anonymous_classes[cls, expanded_key] = AnonSubclass
@@ -409,17 +673,39 @@ class KwargTypeMeta(type):
 
 
 class List(list, metaclass=KwargTypeMeta):
+    __slots__ = ()
+
     _item_type = None
     _getitem_kwargs = {"item_type": None}
 
     def serialize(self) -> bytes:
         assert self._item_type is not None
-        return b"".join([self._item_type(i).serialize() for i in self])
+
+        if _has_fast_int_path(self._item_type):
+            buf = bytearray(len(self) * self._item_type._size)
+            _pack_int_items(self, self._item_type, buf, 0)
+            return bytes(buf)
+
+        item_type = self._item_type
+        return b"".join(
+            [(i if type(i) is item_type else item_type(i)).serialize() for i in self]
+        )
 
     @classmethod
     def deserialize(cls, data: bytes) -> Tuple["LVList", bytes]:
         assert cls._item_type is not None
 
+        if _has_fast_int_path(cls._item_type):
+            count, extra = divmod(len(data), cls._item_type._size)
+
+            if extra:
+                raise ValueError(
+                    f"Data is too short to contain {cls._item_type._size} bytes"
+                )
+
+            items, data = cls._item_type._bulk_deserialize(data, count)
+            return cls(items), data
+
         lst = cls()
         while data:
             item, data = cls._item_type.deserialize(data)
@@ -429,6 +715,8 @@ class List(list, metaclass=KwargTypeMeta):
 
 
 class LVList(list, metaclass=KwargTypeMeta):
+    __slots__ = ()
+
     _item_type = None
     _length_type = uint8_t
 
@@ -436,14 +724,30 @@ class LVList(list, metaclass=KwargTypeMeta):
 
     def serialize(self) -> bytes:
         assert self._item_type is not None
+
+        if _has_fast_int_path(self._item_type) and _has_fast_int_path(
+            self._length_type
+        ):
+            prefix = self._length_type._size
+            buf = bytearray(prefix + len(self) * self._item_type._size)
+            _pack_int_items((len(self),), self._length_type, buf, 0)
+            _pack_int_items(self, self._item_type, buf, prefix)
+            return bytes(buf)
+
+        item_type = self._item_type
         return self._length_type(len(self)).serialize() + b"".join(
-            [self._item_type(i).serialize() for i in self]
+            [(i if type(i) is item_type else item_type(i)).serialize() for i in self]
         )
 
     @classmethod
     def deserialize(cls, data: bytes) -> Tuple["LVList", bytes]:
         assert cls._item_type is not None
         length, data = cls._length_type.deserialize(data)
+
+        if _has_fast_int_path(cls._item_type):
+            items, data = cls._item_type._bulk_deserialize(data, length)
+            return cls(items), data
+
         r = cls()
         for i in range(length):
             item, data = cls._item_type.deserialize(data)
@@ -452,6 +756,8 @@ class LVList(list, metaclass=KwargTypeMeta):
 
 
 class FixedList(list, metaclass=KwargTypeMeta):
+    __slots__ = ()
+
     _item_type = None
     _length = None
 
@@ -465,11 +771,36 @@ class FixedList(list, metaclass=KwargTypeMeta):
                 f"Invalid length for {self!r}: expected {self._length}, got {len(self)}"
             )
 
-        return b"".join([self._item_type(i).serialize() for i in self])
+        if self._item_type is uint8_t:
+            # Lists of octets *are* their serialized form
+            return bytes(self)
+
+        if _has_fast_int_path(self._item_type):
+            buf = bytearray(len(self) * self._item_type._size)
+            _pack_int_items(self, self._item_type, buf, 0)
+            return bytes(buf)
+
+        item_type = self._item_type
+        return b"".join(
+            [(i if type(i) is item_type else item_type(i)).serialize() for i in self]
+        )
 
     @classmethod
     def deserialize(cls, data: bytes) -> Tuple["FixedList", bytes]:
         assert cls._item_type is not None
+
+        if cls._item_type is uint8_t:
+            chunk = data[: cls._length]
+
+            if len(chunk) < cls._length:
+                raise ValueError(f"Data is too short to contain {cls._length} bytes")
+
+            return cls(int.__new__(uint8_t, b) for b in chunk), data[cls._length :]
+
+        if _has_fast_int_path(cls._item_type):
+            items, data = cls._item_type._bulk_deserialize(data, cls._length)
+            return cls(items), data
+
         r = cls()
         for i in range(cls._length):
             item, data = cls._item_type.deserialize(data)
@@ -478,14 +809,16 @@ class FixedList(list, metaclass=KwargTypeMeta):
 
 
 class CharacterString(str):
+    __slots__ = ("raw",)
+
     _prefix_length = 1
+    _len_packer = struct.Struct("<B")
+    _max_length = 2 ** 8 - 1
 
     def serialize(self):
-        if len(self) >= pow(256, self._prefix_length) - 1:
+        if len(self) >= self._max_length:
             raise ValueError("String is too long")
-        return len(self).to_bytes(
-            self._prefix_length, "little", signed=False
-        ) + self.encode("utf8")
+        return self._len_packer.pack(len(self)) + self.encode("utf8")
 
     @classmethod
     def deserialize(cls, data):
@@ -497,18 +830,30 @@ class CharacterString(str):
         if len(data) < cls._prefix_length + length:
             raise ValueError("Data is too short")
 
-        raw = data[cls._prefix_length : cls._prefix_length + length]
-        r = cls(raw.split(b"\x00")[0].decode("utf8", errors="replace"))
+        # Materialize the payload: `data` may be a memoryview
+        raw = bytes(data[cls._prefix_length : cls._prefix_length + length])
+
+        # Ignore everything starting from the first NUL byte, if any
+        idx = raw.find(b"\x00")
+        text = raw if idx < 0 else raw[:idx]
+
+        r = cls(text.decode("utf8", errors="replace"))
         r.raw = raw
         return r, data[cls._prefix_length + length :]
 
 
 class LongCharacterString(CharacterString):
+    __slots__ = ()
+
     _prefix_length = 2
+    _len_packer = struct.Struct("<H")
+    _max_length = 2 ** 16 - 1
 
 
 def LimitedCharString(max_len):  # noqa: N802
     class LimitedCharString(CharacterString):
+        __slots__ = ()
+
         _max_len = max_len
 
         def serialize(self):
@@ -536,46 +881,46 @@ def Optional(optional_item_type):
 class data8(FixedList, item_type=uint8_t, length=1):
     """General data, Discrete, 8 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data16(FixedList, item_type=uint8_t, length=2):
     """General data, Discrete, 16 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data24(FixedList, item_type=uint8_t, length=3):
     """General data, Discrete, 24 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data32(FixedList, item_type=uint8_t, length=4):
     """General data, Discrete, 32 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data40(FixedList, item_type=uint8_t, length=5):
     """General data, Discrete, 40 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data48(FixedList, item_type=uint8_t, length=6):
     """General data, Discrete, 48 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data56(FixedList, item_type=uint8_t, length=7):
     """General data, Discrete, 56 bit."""
 
-    pass
+    __slots__ = ()
 
 
 class data64(FixedList, item_type=uint8_t, length=8):
     """General data, Discrete, 64 bit."""
 
-    pass
+    __slots__ = ()
@@ -94,7 +94,9 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin, metaclass=Registry):
         return c
 
     def deserialize(self, data):
-        hdr, data = foundation.ZCLHeader.deserialize(data)
+        # A memoryview makes slicing off each parsed field O(1) instead of copying
+        # the remaining data once per field
+        hdr, data = foundation.ZCLHeader.deserialize(memoryview(data))
         self.debug("ZCL deserialize: %s", hdr)
         if hdr.frame_control.frame_type == foundation.FrameType.CLUSTER_COMMAND:
             # Cluster command
@@ -108,7 +110,7 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin, metaclass=Registry):
                 hdr.frame_control.is_reply = commands[hdr.command_id][2]
             except KeyError:
                 self.warning("Unknown cluster-specific command %s", hdr.command_id)
-                return hdr, data
+                return hdr, bytes(data)
         else:
             # General command
             try:
@@ -116,7 +118,7 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin, metaclass=Registry):
                 hdr.frame_control.is_reply = foundation.COMMANDS[hdr.command_id][1]
             except KeyError:
                 self.warning("Unknown foundation command %s", hdr.command_id)
-                return hdr, data
+                return hdr, bytes(data)
 
         value, data = t.deserialize(data, schema)
         if data != b"":
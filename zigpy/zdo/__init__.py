@@ -22,12 +22,14 @@ class ZDO(zigpy.util.CatchingTaskMixin, zigpy.util.ListenableMixin):
         return data
 
     def deserialize(self, cluster_id, data):
-        hdr, data = types.ZDOHeader.deserialize(cluster_id, data)
+        # A memoryview makes slicing off each parsed field O(1) instead of copying
+        # the remaining data once per field
+        hdr, data = types.ZDOHeader.deserialize(cluster_id, memoryview(data))
         try:
             cluster_details = types.CLUSTERS[cluster_id]
         except KeyError:
             self.warning("Unknown ZDO cluster 0x%04x", cluster_id)
-            return hdr, data
+            return hdr, bytes(data)
 
         args, data = t.deserialize(data, cluster_details[1])
         if data != b"":